@@ -31,10 +31,10 @@ field, which is a result of measurements for each shot.
 import uuid
 import time
 import logging
+import operator
 import warnings
 
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
@@ -44,14 +44,344 @@ from qiskit.result import Result
 from qiskit.providers.backend import BackendV1
 from qiskit.providers.options import Options
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import SINGLE_QUBIT_GATES
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
 
 logger = logging.getLogger(__name__)
 
+# Integer codes for the decoded instruction types.
+_OP_SINGLE = 0
+_OP_CX = 1
+_OP_MEASURE = 2
+_OP_RESET = 3
+_OP_UNITARY = 4
+_OP_BFUNC = 5
+_OP_SKIP = 6
+
+# Statevector dtypes for the supported simulation precisions.
+_PRECISION_DTYPES = {"double": np.complex128, "single": np.complex64}
+
+# Number of amplitude pairs updated at a time by single-qubit gates on high
+# qubits, so that both halves and the temporaries stay resident in cache.
+_SINGLE_QUBIT_BLOCK_SIZE = 2**14
+
+# Maximum number of amplitudes gathered at a time by N-qubit unitaries, which
+# bounds the temporary copies made for the matrix product.
+_UNITARY_BLOCK_SIZE = 2**16
+
+# CX gates on adjacent qubits below this qubit use a single swap of the
+# control=1 amplitudes, which is cheaper while the swapped runs are short.
+_ADJACENT_CX_MAX_QUBIT = 8
+
+# Number of shots in each independently seeded block when shots run in parallel.
+# This is fixed so that results do not depend on the number of workers.
+_PARALLEL_SHOT_BLOCK_SIZE = 128
+
+# Comparison functions for the relations supported by bfunc instructions.
+_BFUNC_RELATIONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _apply_single_qubit_gate(gate, psi0, psi1, temps=None):
+    """Apply a single-qubit gate in place to the two halves of a statevector.
+
+    Args:
+        gate (matrix_like): a single-qubit unitary matrix.
+        psi0 (array): the amplitudes where the target qubit is 0.
+        psi1 (array): the amplitudes where the target qubit is 1.
+        temps (tuple): optional pair of preallocated work arrays with the same
+            shape as ``psi0``.
+    """
+    if temps is None:
+        temp0 = np.multiply(psi0, gate[1][0])
+        temp1 = np.multiply(psi1, gate[0][1])
+    else:
+        temp0 = np.multiply(psi0, gate[1][0], out=temps[0])
+        temp1 = np.multiply(psi1, gate[0][1], out=temps[1])
+    # Update both halves with in-place AXPY-style operations
+    np.multiply(psi0, gate[0][0], out=psi0)
+    np.add(psi0, temp1, out=psi0)
+    np.multiply(psi1, gate[1][1], out=psi1)
+    np.add(psi1, temp0, out=psi1)
+
+
+def _run_shot_block(seed_and_shots, simulator, instructions, global_phase, num_random):
+    """Run a block of shots with its own random number generator.
+
+    Args:
+        seed_and_shots (tuple): the ``SeedSequence`` and number of shots for the block.
+        simulator (QasmSimulatorPy): the simulator to run the shots on.
+        instructions (list): the decoded instructions of the experiment.
+        global_phase (float): the global phase of the experiment.
+        num_random (int): the number of random numbers used by each shot.
+
+    Returns:
+        array: the classical memory of each shot as an integer.
+    """
+    seed_sequence, shots = seed_and_shots
+    random_state = np.random.RandomState(np.random.MT19937(seed_sequence))
+    return simulator._run_shots(instructions, global_phase, shots, num_random, random_state)
+
+
+def _outcome_dtype(num_cmembits):
+    """Return the array dtype that holds classical memory values of this size."""
+    return np.int64 if num_cmembits < 64 else object
+
+
+def _instruction_qubits(opcode, args):
+    """Return the qubits acted on by a decoded instruction."""
+    if opcode == _OP_SINGLE:
+        return (args[1],)
+    if opcode in (_OP_MEASURE, _OP_RESET):
+        return (args[0],)
+    if opcode == _OP_CX:
+        return args
+    if opcode == _OP_UNITARY:
+        return tuple(args[1])
+    return ()
+
+
+def _skip_dead_operations(instructions, num_qubits, num_cmembits):
+    """Mark measurements and resets that cannot change the experiment result.
+
+    A measurement is dead if its memory and register bits are overwritten
+    before being read and its qubit is afterwards only measured or reset.
+    A reset is dead if its qubit is not acted on again, or is next reset
+    unconditionally. The final state of the qubits is assumed to be
+    discarded.
+
+    Dead operations are replaced by skip instructions with the same
+    condition and the opcode of the operation as argument, which only consume
+    the random number of the operation so that the random numbers used by the
+    following operations are unchanged.
+
+    Args:
+        instructions (list): decoded ``(opcode, condition, args)`` instructions.
+        num_qubits (int): the number of qubits of the experiment.
+        num_cmembits (int): the number of classical memory bits, which are
+            all read at the end of the experiment.
+
+    Returns:
+        list: the decoded instructions with the dead operations skipped.
+    """
+    marked = []
+    # Masks of the classical bits that are read before being written
+    live_memory = (1 << num_cmembits) - 1
+    live_register = 0
+    # Qubits whose state is only measured or discarded from here on
+    discarded = set(range(num_qubits))
+    # Qubits whose state is discarded without being measured from here on
+    idle = set(discarded)
+    for instruction in reversed(instructions):
+        opcode, condition, args = instruction
+        if opcode == _OP_MEASURE:
+            qubit, cmembit, cregbit = args
+            membit = 1 << cmembit
+            regbit = 0 if cregbit is None else 1 << cregbit
+            if qubit in discarded and not (live_memory & membit or live_register & regbit):
+                marked.append((_OP_SKIP, condition, (opcode,)))
+                continue
+            if condition is None:
+                live_memory &= ~membit
+                live_register &= ~regbit
+            idle.discard(qubit)
+        elif opcode == _OP_RESET:
+            qubit = args[0]
+            if qubit in idle:
+                marked.append((_OP_SKIP, condition, (opcode,)))
+                continue
+            if condition is None:
+                discarded.add(qubit)
+                idle.add(qubit)
+        elif opcode == _OP_BFUNC:
+            _, mask, _, cregbit, cmembit = args
+            if condition is None:
+                live_register &= ~(1 << cregbit)
+                if cmembit is not None:
+                    live_memory &= ~(1 << cmembit)
+            live_register |= mask
+        else:
+            for qubit in _instruction_qubits(opcode, args):
+                discarded.discard(qubit)
+                idle.discard(qubit)
+        if condition is not None:
+            use_register, mask, _ = condition
+            if use_register:
+                live_register |= mask
+            else:
+                live_memory |= mask
+        marked.append(instruction)
+    marked.reverse()
+    return marked
+
+
+def _fuse_single_qubit_gates(instructions):
+    """Fuse runs of single-qubit gates acting on the same qubit.
+
+    Two unconditional single-qubit gates on the same qubit are replaced by
+    their product whenever no instruction in between acts on that qubit.
+
+    Args:
+        instructions (list): decoded ``(opcode, condition, args)`` instructions.
+
+    Returns:
+        list: the decoded instructions with fused single-qubit gates.
+    """
+    fused = []
+    # Position in ``fused`` of the last fusable gate on each qubit
+    last_single = {}
+    for opcode, condition, args in instructions:
+        if opcode == _OP_SINGLE and condition is None:
+            gate, qubit = args
+            position = last_single.get(qubit)
+            if position is not None:
+                previous_gate = fused[position][2][0]
+                fused[position] = (_OP_SINGLE, None, (gate @ previous_gate, qubit))
+                continue
+            last_single[qubit] = len(fused)
+        else:
+            for qubit in _instruction_qubits(opcode, args):
+                last_single.pop(qubit, None)
+        fused.append((opcode, condition, args))
+    return fused
+
+
+def _fuse_single_qubit_pairs(instructions):
+    """Fuse adjacent single-qubit gates acting on different qubits.
+
+    Two consecutive unconditional single-qubit gates on different qubits are
+    replaced by a single two-qubit gate given by their tensor product.
+
+    Args:
+        instructions (list): decoded ``(opcode, condition, args)`` instructions.
+
+    Returns:
+        list: the decoded instructions with fused single-qubit gate pairs.
+    """
+    fused = []
+    pending = None
+    for instruction in instructions:
+        opcode, condition, args = instruction
+        if opcode == _OP_SINGLE and condition is None:
+            if pending is None:
+                pending = instruction
+                continue
+            gate0, qubit0 = pending[2]
+            gate1, qubit1 = args
+            if qubit0 != qubit1:
+                fused.append((_OP_UNITARY, None, (np.kron(gate1, gate0), [qubit0, qubit1])))
+                pending = None
+                continue
+        if pending is not None:
+            fused.append(pending)
+            pending = None
+        fused.append(instruction)
+    if pending is not None:
+        fused.append(pending)
+    return fused
+
+
+def _usage_permutation(usage, linked):
+    """Relabel qubits in order of increasing usage, keeping linked qubits together.
+
+    Args:
+        usage (list): the number of instructions acting on each qubit.
+        linked (set): the qubits ``q`` to keep just below qubit ``q + 1``.
+
+    Returns:
+        list: the new label of each qubit.
+    """
+    blocks = []
+    for qubit, _ in enumerate(usage):
+        if qubit - 1 in linked:
+            blocks[-1].append(qubit)
+        else:
+            blocks.append([qubit])
+    blocks.sort(key=lambda block: sum(usage[qubit] for qubit in block) / len(block))
+    permutation = [0] * len(usage)
+    for new_qubit, qubit in enumerate(qubit for block in blocks for qubit in block):
+        permutation[qubit] = new_qubit
+    return permutation
+
+
+def _qubit_permutation(instructions, num_qubits):
+    """Choose a relabelling of qubits that places the most used qubits last.
+
+    A gate on qubit ``q`` pairs amplitudes ``2**q`` apart in the statevector,
+    so gates on high qubits operate on long contiguous blocks of memory while
+    gates on low qubits use short strided slices.  Relabelling the qubits in
+    order of increasing usage therefore runs the most frequent gates with the
+    most cache friendly access pattern.
+
+    Qubits joined by a CX on adjacent qubits are moved together as one block
+    ranked by its mean usage, so the relabelling keeps the CX on adjacent
+    qubits and in the same direction.  This is only done for the pairs that
+    end up low enough for the adjacent CX kernel in
+    :meth:`QasmSimulatorPy._add_unitary_cx`, the other qubits are relabelled
+    by usage alone.
+
+    Args:
+        instructions (list): decoded ``(opcode, condition, args)`` instructions.
+        num_qubits (int): the number of qubits of the experiment.
+
+    Returns:
+        list or None: the new label of each qubit, or ``None`` if the qubits
+        are already in order of increasing usage.
+    """
+    usage = [0] * num_qubits
+    adjacent_cx = set()
+    for opcode, _, args in instructions:
+        for qubit in _instruction_qubits(opcode, args):
+            usage[qubit] += 1
+        if opcode == _OP_CX and abs(args[0] - args[1]) == 1:
+            adjacent_cx.add(min(args))
+    # Link the pairs that are low enough for the adjacent CX kernel when
+    # relabelled by usage alone, then unlink those the links move too high
+    permutation = _usage_permutation(usage, set())
+    linked = {qubit for qubit in adjacent_cx if permutation[qubit] < _ADJACENT_CX_MAX_QUBIT}
+    while linked:
+        linked_permutation = _usage_permutation(usage, linked)
+        low = {qubit for qubit in linked if linked_permutation[qubit] < _ADJACENT_CX_MAX_QUBIT}
+        if low == linked:
+            permutation = linked_permutation
+            break
+        linked = low
+    if permutation == list(range(num_qubits)):
+        return None
+    return permutation
+
+
+def _permute_instruction_qubits(instructions, permutation):
+    """Relabel the qubits of decoded instructions.
+
+    Args:
+        instructions (list): decoded ``(opcode, condition, args)`` instructions.
+        permutation (list): the new label of each qubit.
+
+    Returns:
+        list: the decoded instructions acting on the relabelled qubits.
+    """
+    permuted = []
+    for opcode, condition, args in instructions:
+        if opcode == _OP_SINGLE:
+            args = (args[0], permutation[args[1]])
+        elif opcode == _OP_CX:
+            args = (permutation[args[0]], permutation[args[1]])
+        elif opcode == _OP_UNITARY:
+            args = (args[0], [permutation[qubit] for qubit in args[1]])
+        elif opcode in (_OP_MEASURE, _OP_RESET):
+            args = (permutation[args[0]],) + args[1:]
+        permuted.append((opcode, condition, args))
+    return permuted
+
 
 class QasmSimulatorPy(BackendV1):
     """Python implementation of a qasm simulator."""
@@ -101,7 +431,12 @@ class QasmSimulatorPy(BackendV1):
         ],
     }
 
-    DEFAULT_OPTIONS = {"initial_statevector": None, "chop_threshold": 1e-15}
+    DEFAULT_OPTIONS = {
+        "initial_statevector": None,
+        "chop_threshold": 1e-15,
+        "precision": "double",
+        "max_parallel_shots": 1,
+    }
 
     # Class level variable to return the final state at the end of simulation
     # This should be set to True for the statevector simulator
@@ -119,13 +454,17 @@ class QasmSimulatorPy(BackendV1):
         self._local_random = np.random.RandomState()
         self._classical_memory = 0
         self._classical_register = 0
-        self._statevector = 0
+        self._statevector = None
+        self._qubit_permutation = None
+        self._permuted_initial_statevector = None
         self._number_of_cmembits = 0
         self._number_of_qubits = 0
         self._shots = 0
         self._memory = False
         self._initial_statevector = self.options.get("initial_statevector")
         self._chop_threshold = self.options.get("chop_threashold")
+        self._dtype = _PRECISION_DTYPES[self.options.get("precision")]
+        self._max_parallel_shots = self.options.get("max_parallel_shots")
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
@@ -137,13 +476,40 @@ class QasmSimulatorPy(BackendV1):
             memory=False,
             initial_statevector=None,
             chop_threshold=1e-15,
+            precision="double",
+            max_parallel_shots=1,
             allow_sample_measuring=True,
             seed_simulator=None,
             parameter_binds=None,
         )
 
+    def _qubit_view(self, qubit, other_qubit=None):
+        """Return a view of the statevector with an axis for each given qubit.
+
+        Qubit ``q`` is stored on axis ``N - 1 - q`` of the rank-N statevector
+        tensor. The view merges the axes between the given qubits, so for a
+        single qubit it has shape ``(2**(N - 1 - q), 2, 2**q)``, and for two
+        qubits ``q1 > q0`` it has shape
+        ``(2**(N - 1 - q1), 2, 2**(q1 - 1 - q0), 2, 2**q0)``.
+
+        Args:
+            qubit (int): a qubit to keep an axis for.
+            other_qubit (int or None): an optional second, different qubit
+                to keep an axis for.
+
+        Returns:
+            array: a view of the statevector.
+        """
+        num_qubits = self._number_of_qubits
+        if other_qubit is None:
+            return self._statevector.reshape(2 ** (num_qubits - 1 - qubit), 2, 2**qubit)
+        high, low = (qubit, other_qubit) if qubit > other_qubit else (other_qubit, qubit)
+        return self._statevector.reshape(
+            2 ** (num_qubits - 1 - high), 2, 2 ** (high - 1 - low), 2, 2**low
+        )
+
     def _add_unitary(self, gate, qubits):
-        """Apply an N-qubit unitary matrix.
+        """Apply an N-qubit unitary matrix in place.
 
         Args:
             gate (matrix_like): an N-qubit unitary matrix
@@ -151,35 +517,92 @@ class QasmSimulatorPy(BackendV1):
         """
         # Get the number of qubits
         num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(
-            indexes, gate_tensor, self._statevector, dtype=complex, casting="no"
+        # Move the gate qubit axes to the front, most significant first
+        axes = [self._number_of_qubits - 1 - qubit for qubit in reversed(qubits)]
+        view = np.moveaxis(self._statevector, axes, range(num_qubits))
+        # Contract the gate with blocks of the gathered amplitudes, iterating
+        # over the leading other axes so each block holds a bounded number of
+        # amplitudes
+        num_block_axes = max(0, view.ndim - _UNITARY_BLOCK_SIZE.bit_length() + 1)
+        for index in np.ndindex(*view.shape[num_qubits : num_qubits + num_block_axes]):
+            block = view[(slice(None),) * num_qubits + index]
+            amplitudes = block.reshape(2**num_qubits, -1)
+            block[...] = np.matmul(gate, amplitudes).reshape(block.shape)
+
+    def _add_unitary_single(self, gate, qubit):
+        """Apply a single-qubit unitary matrix in place.
+
+        Args:
+            gate (matrix_like): a single-qubit unitary matrix
+            qubit (int): the qubit to apply gate to.
+        """
+        # View the statevector so that the middle axis is the target qubit
+        view = self._qubit_view(qubit)
+        block_size = _SINGLE_QUBIT_BLOCK_SIZE
+        if 2**qubit <= block_size:
+            _apply_single_qubit_gate(gate, view[:, 0, :], view[:, 1, :])
+            return
+        # For high qubits the paired amplitudes are far apart, so update them
+        # in blocks that fit in cache instead of sweeping each half in turn
+        temps = (
+            np.empty(block_size, dtype=view.dtype),
+            np.empty(block_size, dtype=view.dtype),
         )
+        for outer in view:
+            for start in range(0, 2**qubit, block_size):
+                stop = start + block_size
+                _apply_single_qubit_gate(gate, outer[0, start:stop], outer[1, start:stop], temps)
+
+    def _add_unitary_cx(self, control, target):
+        """Apply a CX gate in place by swapping amplitudes.
 
-    def _get_measure_outcome(self, qubit):
+        Args:
+            control (int): the control qubit.
+            target (int): the target qubit.
+        """
+        low = min(control, target)
+        if abs(control - target) == 1 and low < _ADJACENT_CX_MAX_QUBIT:
+            # The middle axis indexes the two-qubit subspace as 2 * high + low
+            view = self._statevector.reshape(2 ** (self._number_of_qubits - 2 - low), 4, 2**low)
+            pair = view[:, 2:, :] if control > target else view[:, 1::2, :]
+            # Swap the control=1 amplitudes, numpy buffers the overlapping copy
+            pair[...] = pair[:, ::-1, :]
+            return
+        view = self._qubit_view(control, target)
+        # Amplitudes of the control=1 subspace with the target qubit 0 and 1
+        if control > target:
+            psi0 = view[:, 1, :, 0]
+        else:
+            psi0 = view[:, 0, :, 1]
+        psi1 = view[:, 1, :, 1]
+        # Swap the target amplitudes of the control=1 subspace
+        temp = psi0.copy()
+        psi0[...] = psi1
+        psi1[...] = temp
+
+    def _get_measure_outcome(self, qubit, random_number):
         """Simulate the outcome of measurement of a qubit.
 
         Args:
             qubit (int): the qubit to measure
+            random_number (float): a uniform random number in [0, 1) used to
+                sample the outcome.
 
         Return:
-            tuple: pair (outcome, probability) where outcome is '0' or '1' and
-            probability is the probability of the returned outcome.
+            tuple: (outcome, probability, view) where outcome is 0 or 1,
+            probability is the probability of the returned outcome and view is
+            the statevector viewed with the measured qubit as the middle axis.
         """
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
-        # Compute einsum index string for 1-qubit matrix multiplication
-        random_number = self._local_random.rand()
-        if random_number < probabilities[0]:
-            return "0", probabilities[0]
+        # View the statevector so that the middle axis is the measured qubit
+        view = self._qubit_view(qubit)
+        # Marginal probability of the '0' outcome as a single vectorized reduction
+        psi0 = view[:, 0, :]
+        probability0 = np.vdot(psi0, psi0).real
+        if random_number < probability0:
+            return 0, probability0, view
         # Else outcome was '1'
-        return "1", probabilities[1]
+        psi1 = view[:, 1, :]
+        return 1, np.vdot(psi1, psi1).real, view
 
     def _add_sample_measure(self, measure_params, num_samples):
         """Generate memory samples from current statevector.
@@ -190,8 +613,16 @@ class QasmSimulatorPy(BackendV1):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            array: An array of memory values as integers.
         """
+        # Sample from the original qubit layout so that the probabilities are
+        # summed in the same order whatever the qubit permutation
+        statevector = self._unpermuted_statevector()
+        if self._qubit_permutation is not None:
+            original_qubits = np.argsort(self._qubit_permutation).tolist()
+            measure_params = [
+                (original_qubits[qubit], cmembit) for qubit, cmembit in measure_params
+            ]
         # Get unique qubits that are actually measured and sort in
         # ascending order
         measured_qubits = sorted(list({qubit for qubit, cmembit in measure_params}))
@@ -205,72 +636,73 @@ class QasmSimulatorPy(BackendV1):
             # with respect to position from end of the list
             axis.remove(self._number_of_qubits - 1 - qubit)
         probabilities = np.reshape(
-            np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis)), 2**num_measured
+            np.sum(np.abs(statevector) ** 2, axis=tuple(axis), dtype=float), 2**num_measured
         )
+        # Renormalize to absorb rounding errors of single precision statevectors
+        probabilities /= np.sum(probabilities)
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
         samples = self._local_random.choice(range(2**num_measured), num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
+        # Position of each measured qubit in the sampled ints
+        positions = [(measured_qubits.index(qubit), cmembit) for qubit, cmembit in measure_params]
+        # Convert each distinct sample to a memory value only once
+        unique_samples, sample_index = np.unique(samples, return_inverse=True)
+        unique_memory = []
+        for sample in unique_samples.tolist():
             classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
+            for pos, cmembit in positions:
+                qubit_outcome = (sample >> pos) & 1
                 membit = 1 << cmembit
                 classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
-        return memory
+            unique_memory.append(classical_memory)
+        unique_memory = np.array(unique_memory, dtype=_outcome_dtype(self._number_of_cmembits))
+        return unique_memory[sample_index]
 
-    def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
+    def _add_qasm_measure(self, qubit, cmembit, cregbit, random_number):
         """Apply a measure instruction to a qubit.
 
         Args:
             qubit (int): qubit is the qubit measured.
             cmembit (int): is the classical memory bit to store outcome in.
-            cregbit (int, optional): is the classical register bit to store outcome in.
+            cregbit (int or None): is the classical register bit to store outcome in.
+            random_number (float): a uniform random number in [0, 1) used to
+                sample the outcome.
         """
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
+        outcome, probability, view = self._get_measure_outcome(qubit, random_number)
         # update classical state
         membit = 1 << cmembit
-        self._classical_memory = (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
+        self._classical_memory = (self._classical_memory & (~membit)) | (outcome << cmembit)
 
         if cregbit is not None:
             regbit = 1 << cregbit
-            self._classical_register = (self._classical_register & (~regbit)) | (
-                int(outcome) << cregbit
-            )
+            self._classical_register = (self._classical_register & (~regbit)) | (outcome << cregbit)
 
-        # update quantum state
-        if outcome == "0":
-            update_diag = [[1 / np.sqrt(probability), 0], [0, 0]]
-        else:
-            update_diag = [[0, 0], [0, 1 / np.sqrt(probability)]]
-        # update classical state
-        self._add_unitary(update_diag, [qubit])
+        # update quantum state by projecting onto the outcome and renormalizing
+        view[:, 1 - outcome, :] = 0
+        view[:, outcome, :] *= 1 / np.sqrt(probability)
 
-    def _add_qasm_reset(self, qubit):
+    def _add_qasm_reset(self, qubit, random_number):
         """Apply a reset instruction to a qubit.
 
         Args:
             qubit (int): the qubit being rest
+            random_number (float): a uniform random number in [0, 1) used to
+                sample the measurement outcome.
 
         This is done by doing a simulating a measurement
         outcome and projecting onto the outcome state while
         renormalizing.
         """
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
-        # update quantum state
-        if outcome == "0":
-            update = [[1 / np.sqrt(probability), 0], [0, 0]]
-            self._add_unitary(update, [qubit])
+        outcome, probability, view = self._get_measure_outcome(qubit, random_number)
+        # update quantum state by moving the renormalized outcome into |0>
+        if outcome == 0:
+            view[:, 0, :] *= 1 / np.sqrt(probability)
         else:
-            update = [[0, 1 / np.sqrt(probability)], [0, 0]]
-            self._add_unitary(update, [qubit])
+            np.multiply(view[:, 1, :], 1 / np.sqrt(probability), out=view[:, 0, :])
+        view[:, 1, :] = 0
 
     def _validate_initial_statevector(self):
         """Validate an initial statevector"""
@@ -290,6 +722,8 @@ class QasmSimulatorPy(BackendV1):
         # Reset default options
         self._initial_statevector = self.options.get("initial_statevector")
         self._chop_threshold = self.options.get("chop_threshold")
+        precision = self.options.get("precision")
+        self._max_parallel_shots = self.options.get("max_parallel_shots")
         if "backend_options" in backend_options and backend_options["backend_options"]:
             backend_options = backend_options["backend_options"]
 
@@ -315,21 +749,70 @@ class QasmSimulatorPy(BackendV1):
             self._chop_threshold = backend_options["chop_threshold"]
         elif hasattr(qobj_config, "chop_threshold"):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for custom simulation precision
+        if "precision" in backend_options:
+            precision = backend_options["precision"]
+        elif hasattr(qobj_config, "precision"):
+            precision = qobj_config.precision
+        if precision not in _PRECISION_DTYPES:
+            raise BasicAerError(
+                f'invalid precision "{precision}": must be one of {list(_PRECISION_DTYPES)}'
+            )
+        self._dtype = _PRECISION_DTYPES[precision]
+        # Check for custom shot parallelism
+        if "max_parallel_shots" in backend_options:
+            self._max_parallel_shots = backend_options["max_parallel_shots"]
+        elif hasattr(qobj_config, "max_parallel_shots"):
+            self._max_parallel_shots = qobj_config.max_parallel_shots
+        if (
+            not isinstance(self._max_parallel_shots, (int, np.integer))
+            or self._max_parallel_shots < 0
+        ):
+            raise BasicAerError(
+                f"invalid max_parallel_shots {self._max_parallel_shots}: "
+                "must be a non-negative integer"
+            )
 
     def _initialize_statevector(self):
-        """Set the initial statevector for simulation"""
+        """Set the initial statevector for simulation
+
+        The statevector buffer is allocated on the first call for an
+        experiment and reused by every following shot.
+        """
+        if self._statevector is None:
+            # Allocate as a rank-N tensor
+            self._statevector = np.empty(self._number_of_qubits * [2], dtype=self._dtype)
+        vec = self._statevector.reshape(2**self._number_of_qubits)
         if self._initial_statevector is None:
             # Set to default state of all qubits in |0>
-            self._statevector = np.zeros(2**self._number_of_qubits, dtype=complex)
-            self._statevector[0] = 1
+            vec.fill(0)
+            vec[0] = 1
         else:
-            self._statevector = self._initial_statevector.copy()
-        # Reshape to rank-N tensor
-        self._statevector = np.reshape(self._statevector, self._number_of_qubits * [2])
+            vec[:] = self._permuted_initial_statevector
+
+    def _permute_initial_statevector(self):
+        """Return the initial statevector with the relabelled qubits"""
+        if self._initial_statevector is None or self._qubit_permutation is None:
+            return self._initial_statevector
+        # Move each qubit's axis to the position of its new label
+        num_qubits = self._number_of_qubits
+        axes = num_qubits * [0]
+        for qubit, new_qubit in enumerate(self._qubit_permutation):
+            axes[num_qubits - 1 - new_qubit] = num_qubits - 1 - qubit
+        initial = np.reshape(self._initial_statevector, num_qubits * [2])
+        return np.reshape(np.transpose(initial, axes), 2**num_qubits)
+
+    def _unpermuted_statevector(self):
+        """Return the current statevector tensor with the original qubit labels"""
+        if self._qubit_permutation is None:
+            return self._statevector
+        num_qubits = self._number_of_qubits
+        axes = [num_qubits - 1 - new_qubit for new_qubit in reversed(self._qubit_permutation)]
+        return np.ascontiguousarray(np.transpose(self._statevector, axes))
 
     def _get_statevector(self):
         """Return the current statevector"""
-        vec = np.reshape(self._statevector, 2**self._number_of_qubits)
+        vec = np.reshape(self._unpermuted_statevector(), 2**self._number_of_qubits)
         vec[abs(vec) < self._chop_threshold] = 0.0
         return vec
 
@@ -373,6 +856,89 @@ class QasmSimulatorPy(BackendV1):
             # measure sampling is allowed
             self._sample_measure = True
 
+    def _decode_instructions(self, experiment):
+        """Decode the instructions of an experiment for the shot loop.
+
+        Measurements and resets that cannot affect the result are skipped,
+        unless the final statevector is returned. Runs of single-qubit gates
+        acting on the same qubit are then fused into a single gate, and
+        adjacent single-qubit gates on different qubits are then fused into
+        two-qubit gates.
+
+        Args:
+            experiment (QobjExperiment): a qobj experiment.
+
+        Returns:
+            list: a list of ``(opcode, condition, args)`` tuples, one for each
+            instruction that acts on the simulator state. ``condition`` is
+            either ``None`` or a ``(use_register, mask, value)`` tuple and the
+            instruction is only applied if the masked classical register (or
+            memory) is equal to ``value``.
+
+        Raises:
+            BasicAerError: if an instruction is not supported.
+        """
+        instructions = []
+        for operation in experiment.instructions:
+            conditional = getattr(operation, "conditional", None)
+            if isinstance(conditional, int):
+                condition = (True, 1 << conditional, 1 << conditional)
+            elif conditional is not None:
+                mask = int(conditional.mask, 16)
+                value = int(conditional.val, 16)
+                if mask > 0:
+                    # Shift the value to the position of the mask
+                    shift = (mask & -mask).bit_length() - 1
+                    condition = (False, mask, value << shift)
+                else:
+                    condition = None
+            else:
+                condition = None
+
+            if operation.name == "unitary":
+                gate = np.asarray(operation.params[0], dtype=self._dtype)
+                args = (gate, operation.qubits)
+                instructions.append((_OP_UNITARY, condition, args))
+            elif operation.name in SINGLE_QUBIT_GATES:
+                # Compute the gate matrix once for all shots
+                params = getattr(operation, "params", None)
+                gate = single_gate_matrix(operation.name, params).astype(self._dtype)
+                instructions.append((_OP_SINGLE, condition, (gate, operation.qubits[0])))
+            elif operation.name in ("id", "u0", "barrier"):
+                pass
+            elif operation.name in ("CX", "cx"):
+                args = (operation.qubits[0], operation.qubits[1])
+                instructions.append((_OP_CX, condition, args))
+            elif operation.name == "reset":
+                instructions.append((_OP_RESET, condition, (operation.qubits[0],)))
+            elif operation.name == "measure":
+                cregbit = operation.register[0] if hasattr(operation, "register") else None
+                args = (operation.qubits[0], operation.memory[0], cregbit)
+                instructions.append((_OP_MEASURE, condition, args))
+            elif operation.name == "bfunc":
+                relation = _BFUNC_RELATIONS.get(operation.relation)
+                if relation is None:
+                    raise BasicAerError("Invalid boolean function relation.")
+                cmembit = operation.memory if hasattr(operation, "memory") else None
+                args = (
+                    relation,
+                    int(operation.mask, 16),
+                    int(operation.val, 16),
+                    operation.register,
+                    cmembit,
+                )
+                instructions.append((_OP_BFUNC, condition, args))
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicAerError(err_msg.format(backend, operation.name))
+        if not self.SHOW_FINAL_STATE:
+            instructions = _skip_dead_operations(
+                instructions, self._number_of_qubits, self._number_of_cmembits
+            )
+        instructions = _fuse_single_qubit_gates(instructions)
+        return _fuse_single_qubit_pairs(instructions)
+
     def run(self, qobj, **backend_options):
         """Run qobj asynchronously.
 
@@ -386,16 +952,31 @@ class QasmSimulatorPy(BackendV1):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "precision": str
+                * "max_parallel_shots": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "precision" option sets the floating point precision of the
+            simulation and must be either "double" (default) or "single". A
+            "single" precision simulation stores the statevector as complex64,
+            which halves its memory use at the cost of accuracy. Any returned
+            statevector then also has dtype complex64.
+
+            The "max_parallel_shots" option sets the maximum number of worker
+            processes used to run the shots of an experiment. The default of 1
+            runs the shots serially and 0 uses all available CPUs. Parallel
+            shots are seeded in fixed size blocks, so the results for a given
+            seed do not depend on the number of workers.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
+                    "precision": "single",
                 }
         """
         if isinstance(qobj, (QuantumCircuit, list)):
@@ -484,7 +1065,7 @@ class QasmSimulatorPy(BackendV1):
         start = time.time()
         self._number_of_qubits = experiment.config.n_qubits
         self._number_of_cmembits = experiment.config.memory_slots
-        self._statevector = 0
+        self._statevector = None
         self._classical_memory = 0
         self._classical_register = 0
         self._sample_measure = False
@@ -505,133 +1086,74 @@ class QasmSimulatorPy(BackendV1):
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
-        # List of final counts for all shots
-        memory = []
-        # Check if we can sample measurements, if so we only perform 1 shot
-        # and sample all outcomes from the final state vector
+        # Decode the instructions once rather than on every shot
+        instructions = self._decode_instructions(experiment)
+        # Relabel qubits so the most used ones get the most contiguous layout
+        self._qubit_permutation = _qubit_permutation(instructions, self._number_of_qubits)
+        if self._qubit_permutation is not None:
+            instructions = _permute_instruction_qubits(instructions, self._qubit_permutation)
+        # Relabel the initial statevector once rather than on every shot
+        self._permuted_initial_statevector = self._permute_initial_statevector()
+
         if self._sample_measure:
-            shots = 1
-            # Store (qubit, cmembit) pairs for all measure ops in circuit to
-            # be sampled
+            # If sampling we only perform 1 shot and sample all outcomes from
+            # the final statevector, storing the (qubit, cmembit) pairs of all
+            # measure ops in the circuit to be sampled
             measure_sample_ops = []
-        else:
-            shots = self._shots
-        for _ in range(shots):
-            self._initialize_statevector()
-            # apply global_phase
-            self._statevector *= np.exp(1j * global_phase)
-            # Initialize classical memory to all 0
-            self._classical_memory = 0
-            self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, "conditional", None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-
-                # Check if single  gate
-                if operation.name == "unitary":
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in SINGLE_QUBIT_GATES:
-                    params = getattr(operation, "params", None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ("id", "u0"):
-                    pass
-                elif operation.name in ("CX", "cx"):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                # Check if reset
-                elif operation.name == "reset":
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == "barrier":
-                    pass
-                # Check if measure
-                elif operation.name == "measure":
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, "register") else None
-
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
-                elif operation.name == "bfunc":
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, "memory") else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == "==":
-                        outcome = compared == 0
-                    elif relation == "!=":
-                        outcome = compared != 0
-                    elif relation == "<":
-                        outcome = compared < 0
-                    elif relation == "<=":
-                        outcome = compared <= 0
-                    elif relation == ">":
-                        outcome = compared > 0
-                    elif relation == ">=":
-                        outcome = compared >= 0
-                    else:
-                        raise BasicAerError("Invalid boolean function relation.")
-
-                    # Store outcome in register and optionally memory slot
-                    regbit = 1 << cregbit
-                    self._classical_register = (self._classical_register & (~regbit)) | (
-                        int(outcome) << cregbit
-                    )
-                    if cmembit is not None:
-                        membit = 1 << cmembit
-                        self._classical_memory = (self._classical_memory & (~membit)) | (
-                            int(outcome) << cmembit
-                        )
-                else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicAerError(err_msg.format(backend, operation.name))
-
-            # Add final creg data to memory list
+            # Only resets consume random numbers while simulating the single
+            # shot, draw them before sampling the measurements
+            num_random = sum(
+                opcode == _OP_RESET or (opcode == _OP_SKIP and args[0] == _OP_RESET)
+                for opcode, _, args in instructions
+            )
+            random_numbers = iter(self._local_random.rand(num_random).tolist())
+            self._run_shot(instructions, global_phase, random_numbers, measure_sample_ops)
+            outcomes = np.empty(0, dtype=_outcome_dtype(self._number_of_cmembits))
             if self._number_of_cmembits > 0:
-                if self._sample_measure:
-                    # If sampling we generate all shot samples from the final statevector
-                    memory = self._add_sample_measure(measure_sample_ops, self._shots)
+                outcomes = self._add_sample_measure(measure_sample_ops, self._shots)
+        else:
+            # Number of random numbers consumed by measure, reset and skip instructions in a shot
+            num_random = sum(
+                opcode in (_OP_MEASURE, _OP_RESET, _OP_SKIP) for opcode, _, _ in instructions
+            )
+            if self._max_parallel_shots == 1:
+                outcomes = self._run_shots(
+                    instructions, global_phase, self._shots, num_random, self._local_random
+                )
+            else:
+                # Split the shots into fixed size blocks, each with its own
+                # seed, so the results do not depend on the number of workers
+                block_sizes = [
+                    min(_PARALLEL_SHOT_BLOCK_SIZE, self._shots - first_shot)
+                    for first_shot in range(0, self._shots, _PARALLEL_SHOT_BLOCK_SIZE)
+                ]
+                seeds = np.random.SeedSequence(seed_simulator).spawn(len(block_sizes))
+                # Don't send the statevector buffer to the worker processes
+                self._statevector = None
+                blocks = parallel_map(
+                    _run_shot_block,
+                    list(zip(seeds, block_sizes)),
+                    task_args=(self, instructions, global_phase, num_random),
+                    num_processes=self._max_parallel_shots or CPU_COUNT,
+                )
+                if blocks:
+                    outcomes = np.concatenate(blocks)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    outcomes = np.empty(0, dtype=_outcome_dtype(self._number_of_cmembits))
 
         # Add data
-        data = {"counts": dict(Counter(memory))}
+        # Histogram the integer outcomes and only format the distinct values as hex
+        values, first_index, inverse, counts = np.unique(
+            outcomes, return_index=True, return_inverse=True, return_counts=True
+        )
+        hex_values = [hex(value) for value in values.tolist()]
+        # List the counts in order of first occurrence, as a Counter would
+        order = np.argsort(first_index).tolist()
+        counts = counts.tolist()
+        data = {"counts": {hex_values[index]: counts[index] for index in order}}
         # Optionally add memory list
         if self._memory:
-            data["memory"] = memory
+            data["memory"] = [hex_values[index] for index in inverse.tolist()]
         # Optionally add final statevector
         if self.SHOW_FINAL_STATE:
             data["statevector"] = self._get_statevector()
@@ -652,6 +1174,99 @@ class QasmSimulatorPy(BackendV1):
             "header": experiment.header.to_dict(),
         }
 
+    def _run_shot(self, instructions, global_phase, random_numbers, measure_sample_ops=None):
+        """Simulate a single shot of an experiment.
+
+        Args:
+            instructions (list): the decoded instructions of the experiment.
+            global_phase (float): the global phase of the experiment.
+            random_numbers (iterator): the random numbers for the measure and
+                reset instructions of the shot.
+            measure_sample_ops (list): if not None, measure instructions are
+                not applied and their (qubit, cmembit) pairs are appended to
+                this list for later sampling.
+        """
+        self._initialize_statevector()
+        # apply global_phase
+        self._statevector *= np.exp(1j * global_phase)
+        # Initialize classical memory to all 0
+        self._classical_memory = 0
+        self._classical_register = 0
+        # Look up the kernels once rather than on every instruction
+        add_unitary_single = self._add_unitary_single
+        add_unitary = self._add_unitary
+        add_unitary_cx = self._add_unitary_cx
+        add_qasm_measure = self._add_qasm_measure
+        add_qasm_reset = self._add_qasm_reset
+        for opcode, condition, args in instructions:
+            if condition is not None:
+                use_register, mask, value = condition
+                if use_register:
+                    if (self._classical_register & mask) != value:
+                        continue
+                elif (self._classical_memory & mask) != value:
+                    continue
+
+            if opcode == _OP_SINGLE:
+                add_unitary_single(*args)
+            elif opcode == _OP_UNITARY:
+                add_unitary(*args)
+            elif opcode == _OP_CX:
+                add_unitary_cx(*args)
+            elif opcode == _OP_MEASURE:
+                if measure_sample_ops is not None:
+                    # If sampling measurements record the qubit and cmembit
+                    # for this measurement for later sampling
+                    measure_sample_ops.append(args[:2])
+                else:
+                    # If not sampling perform measurement as normal
+                    add_qasm_measure(*args, next(random_numbers))
+            elif opcode == _OP_RESET:
+                add_qasm_reset(*args, next(random_numbers))
+            elif opcode == _OP_SKIP:
+                # Consume the random number of the dead operation, sampled
+                # measurements don't have one
+                if measure_sample_ops is None or args[0] == _OP_RESET:
+                    next(random_numbers)
+            else:
+                relation, mask, val, cregbit, cmembit = args
+                outcome = relation((self._classical_register & mask) - val, 0)
+
+                # Store outcome in register and optionally memory slot
+                regbit = 1 << cregbit
+                self._classical_register = (self._classical_register & (~regbit)) | (
+                    int(outcome) << cregbit
+                )
+                if cmembit is not None:
+                    membit = 1 << cmembit
+                    self._classical_memory = (self._classical_memory & (~membit)) | (
+                        int(outcome) << cmembit
+                    )
+
+    def _run_shots(self, instructions, global_phase, shots, num_random, random_state):
+        """Simulate shots of an experiment one after the other.
+
+        Args:
+            instructions (list): the decoded instructions of the experiment.
+            global_phase (float): the global phase of the experiment.
+            shots (int): the number of shots to simulate.
+            num_random (int): the number of random numbers used by each shot.
+            random_state (RandomState): the random number generator for the shots.
+
+        Returns:
+            array: the classical memory of each shot as an integer.
+        """
+        num_outcomes = shots if self._number_of_cmembits > 0 else 0
+        outcomes = np.empty(num_outcomes, dtype=_outcome_dtype(self._number_of_cmembits))
+        for shot in range(shots):
+            # Draw the random numbers for the whole shot at once
+            random_numbers = iter(random_state.rand(num_random).tolist())
+            self._run_shot(instructions, global_phase, random_numbers)
+            # Add final creg data to the outcomes
+            if num_outcomes:
+                outcomes[shot] = self._classical_memory
+        return outcomes
+
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas."""
         n_qubits = qobj.config.n_qubits
@@ -23,7 +23,8 @@ import numpy as np
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile, assemble
-from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import QasmSimulatorPy, BasicAerError
+from qiskit.providers.basicaer import qasm_simulator
 from qiskit.test import providers
 
 
@@ -150,6 +151,182 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         counts = result.get_counts(0)
         self.assertEqual(counts, target)
 
+    def test_single_precision(self):
+        """Test measurements of a single precision simulation."""
+        shots = 2000
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(3, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.reset(qr[0])
+        circuit.x(qr[2])
+        circuit.measure(qr, cr)
+        job = execute(
+            circuit, backend=self.backend, shots=shots, seed_simulator=self.seed, precision="single"
+        )
+        counts = job.result().get_counts(0)
+        target = {"100": shots / 2, "110": shots / 2}
+        self.assertDictAlmostEqual(counts, target, 0.1 * shots)
+
+    def test_invalid_precision(self):
+        """Test an invalid precision raises an error."""
+        qr = QuantumRegister(1, "qr")
+        cr = ClassicalRegister(1, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.measure(qr, cr)
+        with self.assertRaises(BasicAerError):
+            execute(circuit, backend=self.backend, precision="half")
+
+    def test_parallel_shots(self):
+        """Test parallel shots give the same memory for any number of workers."""
+        shots = 300
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.reset(qr[0])
+        circuit.measure(qr, cr)
+        memories = []
+        for max_parallel_shots in [0, 2, 3]:
+            job = execute(
+                circuit,
+                backend=self.backend,
+                shots=shots,
+                seed_simulator=self.seed,
+                memory=True,
+                max_parallel_shots=max_parallel_shots,
+            )
+            memories.append(job.result().get_memory(0))
+        self.assertEqual(memories[0], memories[1])
+        self.assertEqual(memories[0], memories[2])
+        counts = job.result().get_counts(0)
+        target = {"00": shots / 2, "10": shots / 2}
+        self.assertDictAlmostEqual(counts, target, 0.1 * shots)
+
+    def test_parallel_no_shots(self):
+        """Test parallel shots return empty counts when no shots are run."""
+        qr = QuantumRegister(1, "qr")
+        cr = ClassicalRegister(1, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.measure(qr, cr)
+        circuit.reset(qr)
+        circuit.measure(qr, cr)
+        for max_parallel_shots in [1, 2]:
+            job = execute(
+                circuit, backend=self.backend, shots=0, max_parallel_shots=max_parallel_shots
+            )
+            self.assertEqual(job.result().get_counts(0), {})
+
+    def test_invalid_max_parallel_shots(self):
+        """Test an invalid max_parallel_shots raises an error."""
+        qr = QuantumRegister(1, "qr")
+        cr = ClassicalRegister(1, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.measure(qr, cr)
+        with self.assertRaises(BasicAerError):
+            execute(circuit, backend=self.backend, max_parallel_shots=-1)
+
+    def test_dead_measure_and_reset(self):
+        """Test overwritten measurements and trailing resets."""
+        shots = 2000
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(3, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[1], cr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.reset(qr[0])
+        circuit.x(qr[2]).c_if(cr, 1)
+        circuit.measure(qr[2], cr[2])
+        circuit.measure(qr[1], cr[1])
+        circuit.reset(qr[1])
+        circuit.reset(qr[1])
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        counts = job.result().get_counts(0)
+        target = {"000": shots / 2, "011": shots / 2}
+        self.assertDictAlmostEqual(counts, target, 0.1 * shots)
+
+    def test_measure_sampling_with_reset(self):
+        """Test measure sampling enabled by the qobj on a circuit with a reset."""
+        shots = 1000
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.reset(qr[0])
+        circuit.h(qr[1])
+        circuit.measure(qr, cr)
+        circuit = transpile(circuit, backend=self.backend)
+        qobj = assemble(circuit, shots=shots, seed_simulator=self.seed)
+        qobj.experiments[0].config.allows_measure_sampling = True
+        counts = self.backend.run(qobj).result().get_counts(0)
+        target = {"00": shots / 2, "10": shots / 2}
+        self.assertDictAlmostEqual(counts, target, 0.1 * shots)
+
+    def test_skip_dead_operations(self):
+        """Test only dead measurements and resets are marked to be skipped."""
+        gate = np.eye(2)
+        register_bit1 = (True, 2, 2)
+        instructions = [
+            # Dead: memory and register bit 0 are measured again before being read
+            (qasm_simulator._OP_MEASURE, None, (0, 0, 0)),
+            # Live: register bit 1 is read and memory bit 1 only conditionally overwritten
+            (qasm_simulator._OP_MEASURE, None, (1, 1, 1)),
+            (qasm_simulator._OP_SINGLE, register_bit1, (gate, 2)),
+            # Dead: qubit 2 is not used again
+            (qasm_simulator._OP_RESET, None, (2,)),
+            # Live: conditional measurement of memory bit 1
+            (qasm_simulator._OP_MEASURE, register_bit1, (0, 1, None)),
+            (qasm_simulator._OP_MEASURE, None, (0, 0, 0)),
+        ]
+        marked = qasm_simulator._skip_dead_operations(instructions, 3, 2)
+        self.assertEqual(len(marked), len(instructions))
+        self.assertEqual(marked[0], (qasm_simulator._OP_SKIP, None, (qasm_simulator._OP_MEASURE,)))
+        self.assertEqual(marked[3], (qasm_simulator._OP_SKIP, None, (qasm_simulator._OP_RESET,)))
+        for index in [1, 2, 4, 5]:
+            self.assertIs(marked[index], instructions[index])
+        # A measurement is live if a gate acts on its qubit afterwards
+        instructions = [
+            (qasm_simulator._OP_MEASURE, None, (0, 0, 0)),
+            (qasm_simulator._OP_SINGLE, None, (gate, 0)),
+            (qasm_simulator._OP_MEASURE, None, (0, 0, 0)),
+        ]
+        marked = qasm_simulator._skip_dead_operations(instructions, 1, 1)
+        for index, instruction in enumerate(instructions):
+            self.assertIs(marked[index], instruction)
+
+    def test_qubit_permutation_keeps_adjacent_cx(self):
+        """Test qubit relabelling keeps CX gates on adjacent qubits adjacent."""
+        gate = np.eye(2)
+        instructions = [(qasm_simulator._OP_SINGLE, None, (gate, 0))] * 3
+        instructions += [
+            (qasm_simulator._OP_CX, None, (1, 0)),
+            (qasm_simulator._OP_CX, None, (2, 3)),
+            (qasm_simulator._OP_SINGLE, None, (gate, 3)),
+            (qasm_simulator._OP_CX, None, (1, 4)),
+        ]
+        permutation = qasm_simulator._qubit_permutation(instructions, 5)
+        # Qubits 0 and 1 are most used and move last as a block, as do 2 and 3
+        self.assertEqual(permutation, [3, 4, 1, 2, 0])
+        # Unevenly used qubits linked by adjacent CX gates are not relabelled
+        instructions = [(qasm_simulator._OP_SINGLE, None, (gate, 0))] * 3
+        instructions += [
+            (qasm_simulator._OP_CX, None, (0, 1)),
+            (qasm_simulator._OP_CX, None, (2, 1)),
+        ]
+        self.assertIsNone(qasm_simulator._qubit_permutation(instructions, 3))
+        # Qubits too high for the adjacent CX kernel are relabelled by usage alone
+        instructions = [(qasm_simulator._OP_SINGLE, None, (gate, qubit)) for qubit in range(10)]
+        instructions += [(qasm_simulator._OP_SINGLE, None, (gate, 0))] * 3
+        instructions += [(qasm_simulator._OP_CX, None, (1, 0))] * 2
+        permutation = qasm_simulator._qubit_permutation(instructions, 10)
+        self.assertEqual(permutation, [9, 8, 0, 1, 2, 3, 4, 5, 6, 7])
+
     def test_qasm_simulator(self):
         """Test data counts output for single circuit run against reference."""
         result = self.backend.run(self.qobj).result()
@@ -349,6 +526,28 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         for mem in memory:
             self.assertIn(mem, ["10 00", "10 11"])
 
+    def test_memory_wide_classical_register(self):
+        """Test memory and counts with more than 64 classical bits."""
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(70, "cr")
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr[0])
+        circ.measure(qr[0], cr[69])
+        circ.reset(qr[0])
+        circ.x(qr[1])
+        circ.measure(qr[1], cr[0])
+
+        shots = 50
+        job = execute(circ, backend=self.backend, shots=shots, memory=True)
+        result = job.result()
+        memory = result.get_memory()
+        counts = result.get_counts()
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(sum(counts.values()), shots)
+        for mem in memory:
+            self.assertIn(mem, ["0" * 69 + "1", "1" + "0" * 68 + "1"])
+            self.assertIn(mem, counts)
+
     def test_unitary(self):
         """Test unitary gate instruction"""
         max_qubits = 4
@@ -19,8 +19,9 @@ from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit import QuantumRegister, QuantumCircuit, execute
-from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import state_fidelity
+from qiskit.quantum_info.random import random_unitary, random_statevector
+from qiskit.circuit.library import CXGate
+from qiskit.quantum_info import state_fidelity, Statevector
 
 
 class StatevectorSimulatorTest(providers.BackendTestCase):
@@ -113,6 +114,115 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
         expected = np.exp(1j * 0.6) * np.repeat([[0], [1]], [n_qubits**2 - 1, 1])
         self.assertTrue(np.allclose(actual, expected))
 
+    def test_single_qubit_gate_fusion(self):
+        """Test runs of single-qubit gates on the same qubit"""
+        qr = QuantumRegister(3, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.sx(qr[1])
+        circuit.rz(0.2, qr[0])
+        circuit.cx(qr[0], qr[2])
+        circuit.u(0.1, 0.2, 0.3, qr[0])
+        circuit.x(qr[1])
+        circuit.u(0.4, 0.5, 0.6, qr[2])
+        circuit.rz(0.7, qr[1])
+        circuit.sx(qr[0])
+        job = execute(circuit, self.backend, optimization_level=0)
+        actual = job.result().get_statevector(0)
+        expected = Statevector(circuit)
+        np.testing.assert_allclose(actual, expected.data, atol=1e-10)
+
+    def test_single_qubit_gate_pair_fusion(self):
+        """Test adjacent single-qubit gates on different qubits"""
+        qr = QuantumRegister(4, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.x(qr[3])
+        circuit.h(qr[0])
+        circuit.ry(0.3, qr[2])
+        circuit.cx(qr[2], qr[1])
+        circuit.sx(qr[1])
+        circuit.u(0.1, 0.2, 0.3, qr[3])
+        circuit.rz(0.4, qr[2])
+        job = execute(circuit, self.backend, optimization_level=0)
+        actual = job.result().get_statevector(0)
+        expected = Statevector(circuit)
+        np.testing.assert_allclose(actual, expected.data, atol=1e-10)
+
+    def test_initial_statevector_unevenly_used_qubits(self):
+        """Test initial statevector with gates concentrated on low qubits"""
+        qr = QuantumRegister(4, "qr")
+        circuit = QuantumCircuit(qr)
+        for _ in range(3):
+            circuit.ry(0.3, qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuit.rz(0.5, qr[1])
+        circuit.cx(qr[0], qr[3])
+        circuit.x(qr[3])
+        initial = random_statevector(16, seed=7)
+        job = execute(circuit, self.backend, initial_statevector=initial.data)
+        actual = job.result().get_statevector(0)
+        expected = initial.evolve(circuit)
+        np.testing.assert_allclose(actual, expected.data, atol=1e-10)
+
+    def test_single_qubit_gates_on_high_qubits(self):
+        """Test single-qubit gates on qubits updated in cache blocks"""
+        qr = QuantumRegister(17, "qr")
+        circuit = QuantumCircuit(qr)
+        for index, qubit in enumerate(qr):
+            circuit.ry(0.1 * index, qubit)
+        circuit.cx(qr[16], qr[15])
+        circuit.u(0.1, 0.2, 0.3, qr[15])
+        circuit.cx(qr[15], qr[16])
+        circuit.sx(qr[16])
+        job = execute(circuit, self.backend, optimization_level=0)
+        actual = job.result().get_statevector(0)
+        expected = Statevector(circuit)
+        np.testing.assert_allclose(actual, expected.data, atol=1e-10)
+
+    def test_unitary_on_large_register(self):
+        """Test unitaries applied in blocks on a large register"""
+        qr = QuantumRegister(17, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.unitary(random_unitary(4, seed=5), [qr[0], qr[16]])
+        circuit.unitary(random_unitary(8, seed=6), [qr[9], qr[3], qr[12]])
+        circuit.sx(qr[2])
+        circuit.u(0.1, 0.2, 0.3, qr[14])
+        initial = random_statevector(2**17, seed=8)
+        job = execute(circuit, self.backend, initial_statevector=initial.data)
+        actual = job.result().get_statevector(0)
+        expected = initial.evolve(circuit)
+        np.testing.assert_allclose(actual, expected.data, atol=1e-10)
+
+    def test_adjacent_cx(self):
+        """Test CX gates on adjacent qubits in both directions"""
+        num_qubits = 12
+        initial = random_statevector(2**num_qubits, seed=11)
+        pairs = [(0, 1), (1, 0), (6, 7), (7, 6), (8, 9), (10, 9), (2, 5)]
+        for control, target in pairs:
+            with self.subTest(control=control, target=target):
+                simulator = StatevectorSimulatorPy()
+                simulator._number_of_qubits = num_qubits
+                simulator._statevector = initial.data.reshape(num_qubits * [2]).copy()
+                simulator._add_unitary_cx(control, target)
+                expected = initial.evolve(CXGate(), [control, target])
+                np.testing.assert_allclose(
+                    simulator._statevector.reshape(-1), expected.data, atol=1e-10
+                )
+
+    def test_single_precision(self):
+        """Test single precision simulation"""
+        qr = QuantumRegister(3, "qr")
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.ry(0.3, qr[2])
+        circuit.unitary(random_unitary(4, seed=42), [qr[1], qr[2]])
+        expected = execute(circuit, self.backend).result().get_statevector(0)
+        job = execute(circuit, self.backend, precision="single")
+        actual = job.result().get_statevector(0)
+        self.assertEqual(actual.dtype, np.complex64)
+        np.testing.assert_allclose(actual, expected, atol=1e-6)
+
 
 if __name__ == "__main__":
     unittest.main()